@@ -6,12 +6,13 @@ from .__meta__ import version as __version__
 from qt_thread_updater.thread_updater import is_main_thread, ThreadUpdater
 from qt_thread_updater.global_utils import get_updater, set_updater, cleanup_app,\
     get_global_updater_mngr, set_global_updater_mngr, GlobalUpdaterManager, \
-    is_running, stop, start, unregister_continuous, register_continuous, call_latest, call_in_main, delay
+    is_running, stop, start, unregister_continuous, register_continuous, call_latest, call_in_main, \
+    direct_call_in_main, delay
 
 
 __all__ = [
     'get_updater', 'set_updater', 'cleanup_app', 'ThreadUpdater', 'is_main_thread',
     'get_global_updater_mngr', 'set_global_updater_mngr', 'GlobalUpdaterManager',
     'is_running', 'stop', 'start', 'unregister_continuous', 'register_continuous', 'call_latest', 'call_in_main',
-    'delay',
+    'direct_call_in_main', 'delay',
     ]
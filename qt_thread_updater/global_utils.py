@@ -10,7 +10,7 @@ __all__ = [
     'get_updater', 'set_updater', 'cleanup_app',
     'get_global_updater_mngr', 'set_global_updater_mngr', 'GlobalUpdaterManager',
     'is_running', 'stop', 'start', 'unregister_continuous',
-    'register_continuous', 'call_latest', 'call_in_main', 'delay']
+    'register_continuous', 'call_latest', 'call_in_main', 'direct_call_in_main', 'delay']
 
 
 def get_updater():
@@ -39,15 +39,14 @@ def cleanup_app(app=None):
         for widg in app.allWindows():
             widg.deleteLater()
 
-    for mod in dir(qtpy):
-        try:
-            delattr(getattr(qtpy, mod), 'qApp')
-        except:
-            pass
-        try:
-            setattr(getattr(qtpy, mod), 'qApp', None)
-        except:
-            pass
+    for mod in QAPP_MODULES:
+        if hasattr(mod, 'qApp'):
+            del mod.qApp
+        mod.qApp = None
+
+
+# qtpy modules that have a qApp reference to reset in cleanup_app. Found once instead of on every cleanup.
+QAPP_MODULES = [getattr(qtpy, name) for name in dir(qtpy) if hasattr(getattr(qtpy, name, None), 'qApp')]
 
 
 GLOBAL_UPDATER_MANGER = None
@@ -68,20 +67,28 @@ def set_global_updater_mngr(mngr):
 class GlobalUpdaterManager(object):
 
     def __init__(self):
-        self.lock = threading.RLock()
+        self.lock = threading.Lock()
         self.main_updater = ThreadUpdater()
 
     def get_updater(self):
         """Return the main updater."""
+        # Fast path without the lock. The lock is only needed when the updater has to be created.
+        updater = self.main_updater
+        if updater is not None:
+            return updater
+
         with self.lock:
             if self.main_updater is None:
                 # Create a default updater (may cause issues if this is not created in the main thread)
-                self.main_updater = ThreadUpdater(init_later=True)
+                updater = ThreadUpdater(init_later=True)
 
                 # Init later was temporarily used when the lock was not used. Two thread could create the main_updater
                 # at the same time causing problems.
                 # Initially I did not want to use a lock, because it could break multiprocessing for the module.
-                self.main_updater.init()
+                updater.init()
+
+                # Only set after init. get_updater returns main_updater without the lock, so it must be ready to use.
+                self.main_updater = updater
 
             return self.main_updater
 
@@ -97,7 +104,7 @@ class GlobalUpdaterManager(object):
 
     def __setstate__(self, state):
         """Initialize this object in a separate process."""
-        self.lock = threading.RLock()
+        self.lock = threading.Lock()
         self.main_updater = ThreadUpdater()
 
         if isinstance(state, dict):
@@ -147,10 +154,15 @@ def call_in_main(func, *args, **kwargs):
     return get_updater().call_in_main(func, *args, **kwargs)
 
 
+def direct_call_in_main(func, *args, **kwargs):
+    """Call this function in the main thread's event loop without waiting for the next update call."""
+    return get_updater().direct_call_in_main(func, *args, **kwargs)
+
+
 def delay(seconds, func, *args, **kwargs):
     """Call the given function after the given number of seconds has passed.
 
-    This will not be accurate unless your timeout is at a high rate (lower timeout number).
+    A single timer is started for the function that expires first, so the timeout does not change the accuracy.
 
     Args:
         seconds (float/int): Number of seconds to wait until calling the function.
@@ -2,11 +2,13 @@
 Thread Updater module to help update GUI items in a separate thread.
 """
 import sys
+import math
 import time
+import heapq
+import itertools
 import threading
-import traceback
 import contextlib
-from collections import OrderedDict
+from collections import deque
 
 from qtpy import QtCore, QtWidgets
 
@@ -14,9 +16,12 @@ from qtpy import QtCore, QtWidgets
 __all__ = ['is_main_thread', 'ThreadUpdater']
 
 
+_MAIN_IDENT = threading.main_thread().ident
+
+
 def is_main_thread():
     """Return if the current thread is the main thread."""
-    return threading.current_thread() is threading.main_thread()
+    return threading.get_ident() == _MAIN_IDENT
 
 
 class ThreadUpdater(QtCore.QObject):
@@ -37,6 +42,8 @@ class ThreadUpdater(QtCore.QObject):
     starting = QtCore.Signal()  # Signal to start the timer in the main thread.
     stopping = QtCore.Signal()  # Signal to stop the timer in the main thread.
     creating = QtCore.Signal()  # Signal to create the timer in the main thread.
+    dispatching = QtCore.Signal(object, object, object)  # Signal to call a function in the main thread's event loop.
+    arming = QtCore.Signal()  # Signal to start the delay timer in the main thread.
 
     class DebugTypes:
         PRINT_ERROR = 'print'  # Print to stderr
@@ -48,6 +55,7 @@ class ThreadUpdater(QtCore.QObject):
     RAISE_ERROR = DebugTypes.RAISE_ERROR
 
     DEFAULT_DEBUG_TYPE = PRINT_ERROR
+    MAX_TIMER_INTERVAL = 2**31 - 1  # Maximum QTimer interval in milliseconds
 
     def __init__(self, timeout=1/30, debug_type=None, parent=None, init_later=False, **kwargs):
         """Initialize the ThreadUpdater.
@@ -64,17 +72,23 @@ class ThreadUpdater(QtCore.QObject):
             debug_type = self.DEFAULT_DEBUG_TYPE
 
         # Lock and update variables
-        self._lock = threading.RLock()
-        self._latest_call = OrderedDict()
-        self._every_call = OrderedDict()
-        self._always_call = OrderedDict()
-        self._delay_call = []
+        self._lock = threading.Lock()  # Only held for O(1) container updates. Never re-entered.
+        self._latest_call = {}  # Single dict item set/pop are atomic, so no lock is needed
+        self._every_call = deque()  # deque append/popleft are thread safe, so no lock is needed
+        self._always_call = {}
+        self._always_version = 0  # Incremented every time _always_call changes
+        self._always_snapshot = ()  # Immutable copy of _always_call items used by run_update
+        self._always_snapshot_version = 0
+        self._delay_call = []  # heapq of (expire_time, count, DelayedFunc)
+        self._delay_count = itertools.count()  # Keeps the heap order stable for equal expire times
 
         # Control variables
         self._timeout = timeout
         self.debug_type = debug_type
         self._running = False
+        self._idle = False  # The timer is stopped because there is nothing to call. is_running() is still True.
         self._tmr = None
+        self._delay_tmr = None  # Single shot timer for the next delayed function
 
         # Try to initialize later so thread variables can be set as fast as possible.
         if not init_later:
@@ -83,9 +97,8 @@ class ThreadUpdater(QtCore.QObject):
     def init(self, *args, **kwargs):
         """Initialize here; Try to make creating the object in __init__ as fast as possible and with little complexity.
 
-        This is to
-        reduce the chance that two threads create the global MAIN_UPDATER at the same time. Yes, I've seen this and it
-        was problematic.
+        This is to reduce the chance that two threads create the global `GlobalUpdaterManager.main_updater` at the
+        same time. Yes, I've seen this and it was problematic.
         """
         # Move to main thread before connecting the signals, so signals run in the main thread
         if not is_main_thread():
@@ -95,12 +108,52 @@ class ThreadUpdater(QtCore.QObject):
         self.starting.connect(self.start)
         self.stopping.connect(self.stop)
         self.creating.connect(self.create_timer)
+        self.dispatching.connect(self._dispatch, QtCore.Qt.QueuedConnection)  # Queued even in the main thread
+        self.arming.connect(self.arm_delay_timer)
 
         # Create the timer
         self.create_timer()
         return self
 
-    @contextlib.contextmanager
+    @property
+    def debug_type(self):
+        """Return how errors from the update functions are handled."""
+        return self._debug_type
+
+    @debug_type.setter
+    def debug_type(self, value):
+        """Set how errors from the update functions are handled and select the matching invoke function."""
+        self._debug_type = value
+        if value == self.RAISE_ERROR:
+            self._invoke = self._invoke_raise
+        elif value == self.HIDE_ERROR:
+            self._invoke = self._invoke_hide
+        else:  # value == self.PRINT_ERROR:
+            self._invoke = self._invoke_print
+
+    @staticmethod
+    def _invoke_raise(func, args, kwargs):
+        """Call the function. If an error occurs it will crash the updater and raise the error."""
+        func(*args, **kwargs)
+
+    @staticmethod
+    def _invoke_hide(func, args, kwargs):
+        """Call the function ignoring any errors."""
+        try:
+            func(*args, **kwargs)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _invoke_print(func, args, kwargs):
+        """Call the function printing the traceback of any errors to stderr."""
+        try:
+            func(*args, **kwargs)
+        except Exception:
+            import traceback  # Only import when needed to keep the module import fast
+            # Write once, so a redirected stderr gets one message that cannot interleave with other threads
+            sys.stderr.write(traceback.format_exc() + 'Error in ' + str(getattr(func, '__name__', func)) + '\n')
+
     def handle_error(self, func=None):
         """Context manager to handle exceptions if the unknown update functions cause an error.
 
@@ -110,18 +163,11 @@ class ThreadUpdater(QtCore.QObject):
           * RAISE_ERROR ["raise"]: If an error occurs actually raise the error. This will crash the updater.
         """
         if self.debug_type == self.RAISE_ERROR:
-            yield  # If this errors it will crash the updater and raise teh real error.
+            return RAISE_ERROR_HANDLER  # If this errors it will crash the updater and raise the real error.
         elif self.debug_type == self.HIDE_ERROR:
-            try:
-                yield
-            except Exception:
-                pass
+            return HIDE_ERROR_HANDLER
         else:  # self.debug_type == self.PRINT_ERROR:
-            try:
-                yield
-            except Exception:
-                traceback.print_exc()
-                print('Error in {}'.format(func.__name__), file=sys.stderr)
+            return PrintErrorHandler(func)
 
     @contextlib.contextmanager
     def restart_on_change(self, restart=None):
@@ -148,6 +194,8 @@ class ThreadUpdater(QtCore.QObject):
             except (AttributeError, RuntimeError, Exception):
                 pass
 
+    timeout = property(get_timeout, set_timeout)
+
     def create_timer(self):
         """Actually create the timer."""
         # Check to run this function in the main thread.
@@ -162,8 +210,19 @@ class ThreadUpdater(QtCore.QObject):
         self._tmr.setInterval(int(self.get_timeout() * 1000))
         self._tmr.timeout.connect(self.run_update)
 
+        # One timer is shared by all delayed functions. It is re-armed for the nearest expire time.
+        try:
+            self._delay_tmr.stop()
+        except (AttributeError, RuntimeError):
+            pass
+        self._delay_tmr = QtCore.QTimer()
+        self._delay_tmr.setSingleShot(True)
+        self._delay_tmr.setTimerType(QtCore.Qt.PreciseTimer)
+        self._delay_tmr.timeout.connect(self.run_delayed)
+        self.arm_delay_timer()
+
     def is_running(self):
-        """Return if running."""
+        """Return if running. This is still True while the timer is stopped for being idle."""
         return self._running
 
     def stop(self, set_state=True):
@@ -175,10 +234,15 @@ class ThreadUpdater(QtCore.QObject):
 
         try:
             self._tmr.stop()
-        except:
+        except (AttributeError, RuntimeError):  # Timer is None or the C++ object was deleted
             pass
         if set_state:
             self._running = False
+            self._idle = False
+            try:
+                self._delay_tmr.stop()
+            except (AttributeError, RuntimeError):
+                pass
 
     def start(self):
         """Start the updater timer."""
@@ -189,16 +253,39 @@ class ThreadUpdater(QtCore.QObject):
 
         self.stop(set_state=False)
         self._running = True
+        self._idle = False
         if self._tmr is None:
             self.create_timer()  # Should be in main thread
         self._tmr.start()
+        self.arm_delay_timer()
 
     def ensure_running(self):
-        """If the updater is not running send a safe signal to start it."""
-        if not self.is_running():
+        """If the updater is not running or is stopped for being idle send a safe signal to start it."""
+        if self._idle or not self._running:
+            self._idle = False
             self._running = True
             self.starting.emit()
 
+    def has_queued(self):
+        """Return if there are any functions waiting to be called by the update timer."""
+        return bool(self._always_call or self._latest_call or self._every_call)
+
+    def stop_idle(self):
+        """Stop the update timer while there is nothing to call. Adding a call will start the timer again.
+
+        `is_running()` stays True while the timer is stopped for being idle. The delay timer keeps running, so
+        delayed functions are still called.
+        """
+        try:
+            self._tmr.stop()
+        except (AttributeError, RuntimeError):
+            pass
+        self._idle = True
+
+        # A call could have been added before the idle state was set. That call did not start the timer.
+        if self.has_queued():
+            self.start()
+
     def register_continuous(self, func, *args, **kwargs):
         """Register a function to be called on every update continuously.
 
@@ -206,50 +293,56 @@ class ThreadUpdater(QtCore.QObject):
         """
         with self._lock:
             self._always_call[func] = (args, kwargs)
+            self._always_version += 1
         self.ensure_running()
         return func
 
     def unregister_continuous(self, func):
         """Unregister a function to be called on every update continuously."""
         with self._lock:
-            try:
-                self._always_call.pop(func, None)
-            except:
-                pass
+            self._always_call.pop(func, None)
+            self._always_version += 1
 
     def call_latest(self, func, *args, **kwargs):
         """Call the most recent values for this function in the main thread on the next update call."""
-        with self._lock:
-            self._latest_call[func] = (args, kwargs)
+        self._latest_call[func] = (args, kwargs)
         self.ensure_running()
 
     def now_call_latest(self, func, *args, **kwargs):
         """Call the latest value in the main thread. If this is the main thread call now."""
-        if is_main_thread():
+        if threading.get_ident() == _MAIN_IDENT:  # Inlined is_main_thread()
             func(*args, **kwargs)
         else:
             self.call_latest(func, *args, **kwargs)
 
     def call_in_main(self, func, *args, **kwargs):
         """Call this function in the main thread on the next update call."""
-        with self._lock:
-            try:
-                self._every_call[func].append((args, kwargs))
-            except (KeyError, IndexError, Exception):
-                self._every_call[func] = [(args, kwargs)]
+        self._every_call.append((func, args, kwargs))
         self.ensure_running()
 
     def now_call_in_main(self, func, *args, **kwargs):
         """Call in the main thread. If this is the main thread call now."""
-        if is_main_thread():
+        if threading.get_ident() == _MAIN_IDENT:  # Inlined is_main_thread()
             func(*args, **kwargs)
         else:
             self.call_in_main(func, *args, **kwargs)
 
+    def direct_call_in_main(self, func, *args, **kwargs):
+        """Call this function in the main thread's event loop without waiting for the next update call.
+
+        This posts a queued Qt signal for every call, so the function runs as soon as the main event loop processes
+        it. This has lower latency than `call_in_main`, but every call is a separate Qt event.
+        """
+        self.dispatching.emit(func, args, kwargs)
+
+    def _dispatch(self, func, args, kwargs):
+        """Run a function from the dispatching signal in the main thread."""
+        self._invoke(func, args, kwargs)
+
     def delay(self, seconds, func, *args, **kwargs):
         """Call the given function after the given number of seconds has passed.
 
-        This will not be accurate unless your timeout is at a high rate (lower timeout number).
+        A single timer is started for the function that expires first, so the timeout does not change the accuracy.
 
         Args:
             seconds (float/int): Number of seconds to wait until calling the function.
@@ -257,10 +350,67 @@ class ThreadUpdater(QtCore.QObject):
             *args (tuple): Positional arguments to pass into the function.
             **kwargs (dict): Keyword arguments to pass into the function.
         """
-        now = time.time()  # Note: this is before the lock
+        now = time.monotonic()  # Note: this is before the lock
+        delayed_func = DelayedFunc(now, seconds, func, args, kwargs)
         with self._lock:
-            self._delay_call.append(DelayedFunc(now, seconds, func, args, kwargs))
-        self.ensure_running()
+            heapq.heappush(self._delay_call, (delayed_func.expire_time, next(self._delay_count), delayed_func))
+            is_next = self._delay_call[0][-1] is delayed_func
+
+        # Only re-arm the timer when this function expires before the one the timer is waiting for
+        if is_next:
+            self.arm_delay_timer()
+
+    def arm_delay_timer(self):
+        """Start the delay timer for the delayed function that expires first."""
+        # Check to run this function in the main thread.
+        if not is_main_thread():
+            self.arming.emit()
+            return
+
+        tmr = self._delay_tmr
+        if tmr is None:
+            return
+
+        with self._lock:
+            expire_time = self._delay_call[0][0] if self._delay_call else None
+
+        try:
+            if expire_time is None:
+                tmr.stop()
+            else:
+                # QTimer takes a 32 bit int. Longer waits fire early and run_delayed re-arms for the rest.
+                wait = math.ceil((expire_time - time.monotonic()) * 1000)
+                tmr.start(min(max(wait, 0), self.MAX_TIMER_INTERVAL))
+        except RuntimeError:  # The C++ object was deleted
+            pass
+
+    def run_delayed(self):
+        """Run the delayed functions that have expired and re-arm the delay timer for the next one.
+
+        This function should not be called directly. It is run by the delay timer in the main thread.
+        """
+        with self._lock:
+            delayed = []
+            delay_call = self._delay_call
+            now = time.monotonic()
+            while delay_call and delay_call[0][0] <= now:
+                delayed.append(heapq.heappop(delay_call))
+
+        invoke = self._invoke
+        ran = 0
+        try:
+            for _, _, delayed_func in delayed:
+                ran += 1  # Count before the call, so a function that raises is not run again
+                invoke(delayed_func.func, delayed_func.args, delayed_func.kwargs)
+        finally:
+            # A function raised (RAISE_ERROR). Put the functions that did not run back, so the next timer runs them.
+            if ran < len(delayed):
+                with self._lock:
+                    for item in delayed[ran:]:
+                        heapq.heappush(delay_call, item)
+
+            # Always re-arm. delay() only re-arms when it adds the first function to expire.
+            self.arm_delay_timer()
 
     def run_update(self):
         """Run the stored function calls to update the GUI items in the main thread.
@@ -268,50 +418,115 @@ class ThreadUpdater(QtCore.QObject):
         This function should not be called directly. Call `ThreadUpdater.start()` to run this function on a timer in
         the main thread.
         """
-        # Collect the items using the thread safe lock
-        with self._lock:
-            always = self._always_call.copy()
-            latest, self._latest_call = self._latest_call, OrderedDict()
-            main, self._every_call = self._every_call, OrderedDict()
-            delayed = [self._delay_call.pop(i) for i in reversed(range(len(self._delay_call)))
-                       if self._delay_call[i].can_run()]
-
-        # Start running the functions
-        for delayed_func in delayed:
-            with self.handle_error(delayed_func.func):
-                delayed_func.func(*delayed_func.args, **delayed_func.kwargs)
+        # Only rebuild the continuous snapshot when register/unregister changed the version
+        version = self._always_version
+        if version != self._always_snapshot_version:
+            with self._lock:
+                self._always_snapshot = tuple(self._always_call.items())
+                self._always_snapshot_version = version
+        always = self._always_snapshot
+
+        # Nothing to do. Stop the timer until ensure_running is called again.
+        if not (always or self._latest_call or self._every_call):
+            self.stop_idle()
+            return
 
-        for func, (args, kwargs) in always.items():
-            with self.handle_error(func):
-                func(*args, **kwargs)
+        # Start running the functions. Use a local variable to avoid the attribute lookup for every call.
+        invoke = self._invoke
+        for func, (args, kwargs) in always:
+            invoke(func, args, kwargs)
 
-        for func, (args, kwargs) in latest.items():
-            with self.handle_error(func):
-                func(*args, **kwargs)
+        # Pop every latest value instead of swapping the dict. A thread could still be setting a value in a swapped
+        # dict, which would lose that value.
+        latest = self._latest_call
+        pop = latest.pop
+        for func in list(latest):
+            item = pop(func, None)
+            if item is not None:
+                invoke(func, item[0], item[1])
 
-        for func, li in main.items():
-            for args, kwargs in li:
-                with self.handle_error(func):
-                    func(*args, **kwargs)
+        # Only run the calls that were queued before this update. New calls are run on the next update.
+        main = self._every_call
+        popleft = main.popleft
+        for _ in range(len(main)):
+            func, args, kwargs = popleft()
+            invoke(func, args, kwargs)
 
 
 class DelayedFunc(object):
     def __init__(self, start_time, delay_time, func, args, kwargs):
+        """Initialize the delayed function.
+
+        Args:
+            start_time (float): `time.monotonic()` value when the delay started.
+            delay_time (float/int): Number of seconds to wait until calling the function.
+            func (callable): Function to call.
+            args (tuple): Positional arguments to pass into the function.
+            kwargs (dict): Keyword arguments to pass into the function.
+        """
         self.start_time = start_time
         self.delay_time = delay_time
+        self.expire_time = start_time + delay_time
         self.func = func
         self.args = args
         self.kwargs = kwargs
 
     def can_run(self):
         """Return if the time to wait is over."""
-        return (time.time() - self.start_time) >= self.delay_time
+        return time.monotonic() >= self.expire_time
 
     def wait_for(self, from_time=None):
         """Return the number of seconds from now until this function should run."""
         if from_time is None:
-            from_time = time.time()
-        wait = (self.start_time + self.delay_time) - from_time
+            from_time = time.monotonic()
+        wait = self.expire_time - from_time
         if wait < 0:
             wait = 0
         return wait
+
+
+class RaiseErrorHandler(object):
+    """Context manager that does not handle errors, so they are raised."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class HideErrorHandler(object):
+    """Context manager that ignores any errors."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return exc_type is not None and issubclass(exc_type, Exception)
+
+
+class PrintErrorHandler(object):
+    """Context manager that prints the traceback of any errors to stderr."""
+    __slots__ = ('func',)
+
+    def __init__(self, func=None):
+        self.func = func
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None or not issubclass(exc_type, Exception):
+            return False
+
+        import traceback  # Only import when needed to keep the module import fast
+        msg = ''.join(traceback.format_exception(exc_type, exc_val, exc_tb))
+        sys.stderr.write(msg + 'Error in ' + str(getattr(self.func, '__name__', self.func)) + '\n')
+        return True
+
+
+# Error handlers without state can be shared
+RAISE_ERROR_HANDLER = RaiseErrorHandler()
+HIDE_ERROR_HANDLER = HideErrorHandler()
@@ -18,16 +18,31 @@ def clipboard(text=None):
         app.clipboard().setText(text)
 
 
+BRUSH_CACHE = {}  # {color: QBrush} QBrush is implicitly shared, so one brush can be used for every format
+
+
+def brush_for(color):
+    """Return a cached QBrush for the given color, so color names are only parsed once."""
+    key = color.rgba() if isinstance(color, QtGui.QColor) else color
+    try:
+        return BRUSH_CACHE[key]
+    except KeyError:
+        brush = BRUSH_CACHE[key] = QtGui.QBrush(QtGui.QColor(color))
+        return brush
+
+
 class QuickPlainTextEdit(QtWidgets.QPlainTextEdit):
     """QuickPlainTextEdit allows you to quickly write text in a separate thread."""
 
     DEFAULT_MAX_BLOCKS = 800
+    MAX_DRAIN_PER_TICK = 64 * 1024  # Maximum number of characters to display per update
 
     def __init__(self, *args, **kwargs):
         super(QuickPlainTextEdit, self).__init__(*args, **kwargs)
 
-        self._queue_lock = threading.RLock()
+        self._queue_lock = threading.Lock()
         self._queue = deque()
+        self._write_cursor = None
 
         vert_bar = self.verticalScrollBar()
         self._last_scroll_range = (vert_bar.minimum(), vert_bar.maximum())
@@ -106,26 +121,55 @@ class QuickPlainTextEdit(QtWidgets.QPlainTextEdit):
         """Put data on the queue to add to the TextEdit view."""
         text = str(text)
         if len(text) > 0:
+            # Lock so the append cannot go to an old queue that setMaximumBlockCount is replacing
             with self._queue_lock:
-                self._queue += text
-            get_updater().call_latest(self.update_display)
+                self._queue.append(text)
+            self.schedule_update()
+
+    def get_write_cursor(self):
+        """Return the cursor used to insert text at the end of the document.
+
+        The cursor is reused between updates instead of creating a new cursor every update.
+        """
+        cursor = self._write_cursor
+        if cursor is None or cursor.document() is not self.document():
+            cursor = self._write_cursor = QtGui.QTextCursor(self.document())
+        cursor.movePosition(QtGui.QTextCursor.End)
+        return cursor
+
+    def clear(self):
+        """Clear the text and the cached write cursor."""
+        self._write_cursor = None
+        super().clear()
+
+    def schedule_update(self):
+        """Call update_display on the next update. Calling this many times before the update only updates once."""
+        get_updater().call_latest(self.update_display)
 
     def update_display(self):
         """Update the display by taking data off of the queue and displaying it in the widget."""
-        with self._queue_lock:
-            text = ''.join((self._queue.popleft() for _ in range(len(self._queue))))
+        queue = self._queue
+        chunks = []
+        size = 0
+        while size < self.MAX_DRAIN_PER_TICK:
+            try:
+                chunk = queue.popleft()
+            except IndexError:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+        text = ''.join(chunks)
+
+        # Display the rest on the next update to keep the GUI responsive
+        if queue:
+            self.schedule_update()
 
         if len(text) == 0:
             return
 
-        cursor = QtGui.QTextCursor(self.textCursor())
+        cursor = self.get_write_cursor()
         cursor.beginEditBlock()
 
-        # Move and check the position
-        # old_pos = cursor.position()
-        cursor.movePosition(QtGui.QTextCursor.End)
-        # is_end = cursor.position() == old_pos
-
         # Insert the text (This will insert text even without setTextCursor)
         try:
             cursor.insertText(text)
@@ -160,13 +204,17 @@ class QuickTextEdit(QtWidgets.QTextEdit):
     """
 
     DEFAULT_MAX_BLOCKS = 800
+    MAX_DRAIN_PER_TICK = 64 * 1024  # Maximum number of characters to display per update
+    MAX_FORMAT_CACHE = 64
 
     def __init__(self, *args, **kwargs):
         super(QuickTextEdit, self).__init__(*args, **kwargs)
 
-        self._queue_lock = threading.RLock()
+        self._queue_lock = threading.Lock()
         self._queue = deque()
+        self._write_cursor = None
         self._orig_fmt = None
+        self._fmt_cache = {}  # {(id(fmt) or None, color): (base fmt copy, write fmt)}
 
         vert_bar = self.verticalScrollBar()
         self._last_scroll_range = (vert_bar.minimum(), vert_bar.maximum())
@@ -255,38 +303,97 @@ class QuickTextEdit(QtWidgets.QTextEdit):
         """
         text = str(text)
         if len(text) > 0:
-            # Get and copy the format. Do not permanently change the format
-            if fmt is None:
-                fmt = self._orig_fmt or self.currentCharFormat()
-            fmt = QtGui.QTextCharFormat(fmt)
-
-            # Change the color
-            if color is not None:
-                fmt.setForeground(QtGui.QBrush(QtGui.QColor(color)))
+            fmt = self.get_write_format(fmt, color)
 
             with self._queue_lock:
                 self._queue.append((text, fmt))
 
-            get_updater().call_latest(self.update_display)
+            self.schedule_update()
+
+    def get_write_format(self, fmt=None, color=None):
+        """Return a copy of the format with the color applied. Do not permanently change the given format.
+
+        The returned format is cached for the given fmt and color, so writing with the same arguments does not create
+        new Qt objects. The returned format should not be modified.
+
+        Args:
+            fmt (QTextCharFormat)[None]: Base text format. If None the currentCharFormat() is used.
+            color (str/QColor)[None]: String color name to write the text foreground with.
+        """
+        key = (None if fmt is None else id(fmt), color.rgba() if isinstance(color, QtGui.QColor) else color)
+        if fmt is None:
+            fmt = self._orig_fmt or self.currentCharFormat()
+
+        # Compare the base format in case the id was reused or the format changed
+        try:
+            base, write_fmt = self._fmt_cache[key]
+            if base == fmt:
+                return write_fmt
+        except KeyError:
+            pass
+
+        write_fmt = QtGui.QTextCharFormat(fmt)
+        if color is not None:
+            write_fmt.setForeground(brush_for(color))
+
+        if len(self._fmt_cache) >= self.MAX_FORMAT_CACHE:
+            self._fmt_cache.clear()
+        self._fmt_cache[key] = (QtGui.QTextCharFormat(fmt), write_fmt)
+        return write_fmt
+
+    def get_write_cursor(self):
+        """Return the cursor used to insert text at the end of the document.
+
+        The cursor is reused between updates instead of creating a new cursor every update.
+        """
+        cursor = self._write_cursor
+        if cursor is None or cursor.document() is not self.document():
+            cursor = self._write_cursor = QtGui.QTextCursor(self.document())
+        cursor.movePosition(QtGui.QTextCursor.End)
+        return cursor
+
+    def clear(self):
+        """Clear the text and the cached write cursor."""
+        self._write_cursor = None
+        super().clear()
+
+    def schedule_update(self):
+        """Call update_display on the next update. Calling this many times before the update only updates once."""
+        get_updater().call_latest(self.update_display)
 
     def update_display(self):
         """Update the display by taking data off of the queue and displaying it in the widget."""
+        items = []
+        size = 0
         with self._queue_lock:
-            items = tuple(self._queue.popleft() for _ in range(len(self._queue)))
+            queue = self._queue
+            while queue and size < self.MAX_DRAIN_PER_TICK:
+                item = queue.popleft()
+                items.append(item)
+                size += len(item[0])
+            has_more = len(queue) > 0
+
+        # Display the rest on the next update to keep the GUI responsive
+        if has_more:
+            self.schedule_update()
 
         if len(items) == 0:
             return
 
         self._orig_fmt = QtGui.QTextCharFormat(self.currentCharFormat())
-        cursor = QtGui.QTextCursor(self.textCursor())
+        cursor = self.get_write_cursor()
 
-        # Move and check the position
-        # old_pos = cursor.position()
-        cursor.movePosition(QtGui.QTextCursor.End)
-        # is_end = cursor.position() == old_pos
+        # Join consecutive text with the same format, so each run of text is inserted once
+        runs = []
+        for text, fmt in items:
+            if runs and runs[-1][1] == fmt:
+                runs[-1][0].append(text)
+            else:
+                runs.append(([text], fmt))
 
         # Insert the text
-        for text, fmt in items:
+        for texts, fmt in runs:
+            text = ''.join(texts)
             cursor.beginEditBlock()
             # cursor.setCharFormat(fmt)
             try:
@@ -326,6 +433,7 @@ class StreamWrite(object):
         self.iostreams = [stream for stream in iostreams]
         self.color = color
         self.fmt = fmt
+        self._supports_color = {}  # {id(stream): bool} if the stream's write function accepts color and fmt
 
     def add_stream(self, stream):
         """Add a stream to write to."""
@@ -335,8 +443,20 @@ class StreamWrite(object):
         """Remove a stream."""
         try:
             self.iostreams.remove(stream)
-        except:
+        except ValueError:
             pass
+        self._supports_color.pop(id(stream), None)
+
+    def supports_color(self, stream):
+        """Return if the stream's write function accepts the color and fmt keyword arguments.
+
+        The signature is only inspected the first time a stream is written to.
+        """
+        try:
+            return self._supports_color[id(stream)]
+        except KeyError:
+            supports = self._supports_color[id(stream)] = 'color' in inspect.signature(stream.write).parameters
+            return supports
 
     def write(self, text, color=None, fmt=None, **kwargs):
         """Write the text to all of the streams.
@@ -360,8 +480,7 @@ class StreamWrite(object):
 
         for stream in self.iostreams:
             try:
-                sig = inspect.signature(stream.write)
-                if 'color' in sig.parameters:
+                if self.supports_color(stream):
                     stream.write(text, color=color, fmt=fmt, **kwargs)
                 else:
                     stream.write(text, **kwargs)
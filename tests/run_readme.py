@@ -1,9 +1,16 @@
+"""
+Run the README examples.
+
+The examples are safe to run on a free-threaded Python build (``PYTHON_GIL=0``). Only the producer thread writes the
+counters and the alive flag is only set from the main thread. The updater uses single dict item set/pop, thread safe
+deque append/popleft or a lock, so `call_latest`, `call_in_main` and `delay` can be called from any thread. The
+continuous example reads a counter that another thread is writing, so the label may show a slightly old value.
+"""
 from qt_thread_updater import cleanup_app
 
 
 def run_simple_thread_example():
     """Run the normal usage thread example."""
-    import time
     import threading
     from qtpy import QtWidgets
     from qt_thread_updater import get_updater
@@ -14,23 +21,31 @@ def run_simple_thread_example():
     lbl.resize(300, 300)
     lbl.show()
 
-    data = {'counter': 0}
+    # Released in the main thread after the label is updated, so the thread only runs at the update rate
+    drained = threading.Semaphore(0)
+
+    def set_text(text):
+        lbl.setText(text)
+        drained.release()
 
     def run(is_alive):
-        is_alive.set()
-        while is_alive.is_set():
-            text = 'Latest Count: {}'.format(data['counter'])
-            get_updater().call_latest(lbl.setText, text)
-            data['counter'] += 1
-            time.sleep(0.001)  # Not needed (still good to have some delay to release the thread)
+        updater = get_updater()
+        counter = 0
 
-    alive = threading.Event()
+        while is_alive[0]:
+            counter += 1
+            updater.call_latest(set_text, f'Latest Count: {counter}')
+
+            # Wait for the main thread to display the value instead of sleeping. Timeout to check is_alive.
+            drained.acquire(timeout=0.1)
+
+    alive = [True]  # A list flag is cheaper to check than a threading.Event
     th = threading.Thread(target=run, args=(alive,))
     th.start()
 
     get_updater().delay(5, app.quit)  # Quit after 5 seconds
     app.exec_()
-    alive.clear()
+    alive[0] = False
     cleanup_app()
 
 
@@ -55,28 +70,27 @@ def run_continuous_update():
     @qt_thread_updater.register_continuous
     def update():
         """Update the label with the current value."""
-        lbl.setText('Continuous Count: {}'.format(data['counter']))
+        lbl.setText(f'Continuous Count: {data["counter"]}')
 
     # get_updater().register_continuous(update)
 
     def run(is_alive):
-        is_alive.set()
-        while is_alive.is_set():
+        while is_alive[0]:
             data['counter'] += 1
             # time.sleep(0.001)  # Not needed (still good to have some delay to release the thread)
 
-    alive = threading.Event()
+    alive = [True]
     th = threading.Thread(target=run, args=(alive,))
     th.start()
 
     qt_thread_updater.delay(5, app.quit)  # Quit after 5 seconds
     app.exec_()
-    alive.clear()
+    alive[0] = False
     cleanup_app()
 
 
 def run_call_in_main():
-    """Run the updater call_in_main. This will be inefficient and may need to run slower (time.sleep)."""
+    """Run the updater call_in_main. Lines are batched, because every call_in_main call is run in the main thread."""
     import time
     import threading
     from qtpy import QtWidgets
@@ -89,24 +103,81 @@ def run_call_in_main():
     text_edit.setReadOnly(True)
     text_edit.show()
 
-    data = {'counter': 0}
-
     def run(is_alive):
-        is_alive.set()
-        while is_alive.is_set():
-            text = 'Main Count: {}'.format(data['counter'])
-            get_updater().call_in_main(text_edit.append, text)
-            data['counter'] += 1
-            time.sleep(0.01)  # Some delay/waiting is required
-
-    alive = threading.Event()
+        post = get_updater().call_in_main
+        append = text_edit.append
+        counter = 0
+        lines = []
+        last_post = time.monotonic()
+
+        while is_alive[0]:
+            lines.append(f'Main Count: {counter}')
+            counter += 1
+
+            # Post many lines with one append instead of one append per line
+            now = time.monotonic()
+            if len(lines) >= 32 or now - last_post > 0.016:
+                post(append, '\n'.join(lines))
+                lines = []
+                last_post = now
+            time.sleep(0.001)  # Some delay/waiting is required
+
+    alive = [True]
     th = threading.Thread(target=run, args=(alive,))
     th.start()
 
     # Quit after 2 seconds (So many events from call in main 2 waits longer than 2 seconds)
     get_updater().delay(2, app.quit)
     app.exec_()
-    alive.clear()
+    alive[0] = False
+    cleanup_app()
+
+
+def run_invoke_method():
+    """Run a Qt slot in the main thread with QMetaObject.invokeMethod instead of the updater.
+
+    This only works for Qt slots (like QTextEdit.append). Qt's queued connection stores the C++ arguments, so no Python
+    callable or args tuple is kept for every post.
+    """
+    import time
+    import threading
+    from qtpy import QtWidgets
+    from qtpy.QtCore import QMetaObject, Qt, Q_ARG
+    from qt_thread_updater import get_updater
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    text_edit = QtWidgets.QTextEdit()
+    text_edit.resize(300, 300)
+    text_edit.setReadOnly(True)
+    text_edit.show()
+
+    def run(is_alive):
+        invoke = QMetaObject.invokeMethod
+        queued = Qt.QueuedConnection
+        counter = 0
+        lines = []
+        last_post = time.monotonic()
+
+        while is_alive[0]:
+            lines.append(f'Main Count: {counter}')
+            counter += 1
+
+            # Post many lines with one append instead of one append per line
+            now = time.monotonic()
+            if len(lines) >= 32 or now - last_post > 0.016:
+                invoke(text_edit, 'append', queued, Q_ARG(str, '\n'.join(lines)))
+                lines = []
+                last_post = now
+            time.sleep(0.001)  # Some delay/waiting is required
+
+    alive = [True]
+    th = threading.Thread(target=run, args=(alive,))
+    th.start()
+
+    get_updater().delay(2, app.quit)  # Quit after 2 seconds
+    app.exec_()
+    alive[0] = False
     cleanup_app()
 
 
@@ -129,9 +200,6 @@ def run_delay():
     def update_text(set_time):
         text_edit.append('Requested {:.04f} Updated {:.04f}'.format(set_time, time.time() - now))
 
-    # Lower the timeout so it runs at a faster rate.
-    get_updater().timeout = 0  # 0.0001  # Qt runs in milliseconds
-
     get_updater().delay(0.5, update_text, 0.5)
     get_updater().delay(1, update_text, 1)
     get_updater().delay(1.5, update_text, 1.5)
@@ -148,4 +216,5 @@ if __name__ == '__main__':
     run_simple_thread_example()
     run_continuous_update()
     run_call_in_main()
+    run_invoke_method()
     run_delay()
@@ -13,22 +13,28 @@ def run_quickplaintextedit():
     text_edit.resize(300, 300)
     text_edit.show()
 
-    data = {'counter': 0}
-
     def run(is_alive):
-        is_alive.set()
-        while is_alive.is_set():
-            text = 'Main Count: {}\n'.format(data['counter'])
-            text_edit.write(text)
-            data['counter'] += 1
+        write = text_edit.write
+        counter = 0
+        chunk = []
+        chunk_size = 128
+
+        while is_alive[0]:
+            chunk.append(f'Main Count: {counter}\n')
+            counter += 1
+
+            # Write many lines at once instead of one write per line
+            if len(chunk) >= chunk_size:
+                write(''.join(chunk))
+                chunk.clear()
             time.sleep(0.0001)  # Some delay is usually required to let the Qt event loop run (not needed if IO used)
 
-    alive = threading.Event()
+    alive = [True]  # A list flag is cheaper to check than a threading.Event
     th = threading.Thread(target=run, args=(alive,))
     th.start()
 
     app.exec_()
-    alive.clear()
+    alive[0] = False
     cleanup_app()  # Delete the QApplication so a new one can be created and run
 
 
@@ -45,22 +51,28 @@ def run_quicktextedit():
     text_edit.resize(300, 300)
     text_edit.show()
 
-    data = {'counter': 0}
-
     def run(is_alive):
-        is_alive.set()
-        while is_alive.is_set():
-            text = 'Main Count: {}\n'.format(data['counter'])
-            text_edit.write(text, 'blue')
-            data['counter'] += 1
+        write = text_edit.write
+        counter = 0
+        chunk = []
+        chunk_size = 128
+
+        while is_alive[0]:
+            chunk.append(f'Main Count: {counter}\n')
+            counter += 1
+
+            # Write many lines at once instead of one write per line
+            if len(chunk) >= chunk_size:
+                write(''.join(chunk), 'blue')
+                chunk.clear()
             time.sleep(0.0001)  # Some delay is usually required to let the Qt event loop run (not needed if IO used)
 
-    alive = threading.Event()
+    alive = [True]
     th = threading.Thread(target=run, args=(alive,))
     th.start()
 
     app.exec_()
-    alive.clear()
+    alive[0] = False
     cleanup_app()  # Delete the QApplication so a new one can be created and run
 
 
@@ -82,29 +94,27 @@ def run_quicktextedit_redirect():
     sys.stdout = text_edit.redirect(sys.__stdout__, color='blue', fmt=fmt)
     sys.stderr = text_edit.redirect(sys.__stderr__, color='red')
 
-    data = {'counter': 0}
-
     def run(is_alive):
-        is_alive.set()
-        while is_alive.is_set():
-            stdout_text = 'Main Count: {}'.format(data['counter'])  # Print gives \n automatically
-            error_text = 'Error Count: {}'.format(data['counter'])  # Print gives \n automatically
+        # Bind the redirected write functions once instead of using print and looking up sys.stdout/sys.stderr
+        out_write = sys.stdout.write  # The redirect will write to text_edit and stdout
+        err_write = sys.stderr.write  # The redirect will write to text_edit and stderr
 
-            # Print automatically give '\n' with the "end" keyword argument.
-            print(stdout_text)  # Print will write to sys.stdout where the rediect will write to text_edit and stdout
-            print(error_text, file=sys.stderr)  # Print to sys.stderr. Rediect will write to text_edit and stderr
+        counter = 0
+        while is_alive[0]:
+            out_write(f'Main Count: {counter}\n')
+            err_write(f'Error Count: {counter}\n')
 
-            data['counter'] += 1
+            counter += 1
 
-            # Some delay is usually desired. print/sys.__stdout__ uses IO which gives time for Qt's event loop.
+            # Some delay is usually desired. sys.__stdout__ uses IO which gives time for Qt's event loop.
             # time.sleep(0.0001)
 
-    alive = threading.Event()
+    alive = [True]
     th = threading.Thread(target=run, args=(alive,))
     th.start()
 
     app.exec_()
-    alive.clear()
+    alive[0] = False
     cleanup_app()  # Delete the QApplication so a new one can be created and run
 
 